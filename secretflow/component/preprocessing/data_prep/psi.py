@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 from typing import List
 
@@ -146,36 +147,47 @@ def modify_schema(x: DistData, keys: List[str]) -> DistData:
     imeta = IndividualTable()
     assert x.meta.Unpack(imeta)
 
-    new_meta = IndividualTable()
+    keys_set = set(keys)
+    # keys are exactly the current ids, the schema is kept as is.
+    if keys_set == set(imeta.schema.ids) and keys_set.isdisjoint(
+        imeta.schema.features
+    ):
+        return new_x
+
     names = []
     types = []
 
     # copy current ids to features and clean current ids.
-    for i, t in zip(list(imeta.schema.ids), list(imeta.schema.id_types)):
+    for i, t in zip(imeta.schema.ids, imeta.schema.id_types):
         names.append(i)
         types.append(t)
 
-    for f, t in zip(list(imeta.schema.features), list(imeta.schema.feature_types)):
+    for f, t in zip(imeta.schema.features, imeta.schema.feature_types):
         names.append(f)
         types.append(t)
 
-    for k in keys:
-        if k not in names:
-            raise CompEvalError(f"key {k} is not found as id or feature.")
+    missing_keys = keys_set - set(names)
+    if missing_keys:
+        raise CompEvalError(
+            f"keys {sorted(missing_keys)} are not found as id or feature."
+        )
 
-    for n, t in zip(names, types):
-        if n in keys:
-            new_meta.schema.ids.append(n)
-            new_meta.schema.id_types.append(t)
-        else:
-            new_meta.schema.features.append(n)
-            new_meta.schema.feature_types.append(t)
+    # repartition ids and features in place, labels and line_count are kept.
+    schema = imeta.schema
+    schema.ClearField("ids")
+    schema.ClearField("id_types")
+    schema.ClearField("features")
+    schema.ClearField("feature_types")
 
-    new_meta.schema.labels.extend(list(imeta.schema.labels))
-    new_meta.schema.label_types.extend(list(imeta.schema.label_types))
-    new_meta.line_count = imeta.line_count
+    id_pairs = [(n, t) for n, t in zip(names, types) if n in keys_set]
+    feature_pairs = [(n, t) for n, t in zip(names, types) if n not in keys_set]
 
-    new_x.meta.Pack(new_meta)
+    schema.ids.extend(n for n, _ in id_pairs)
+    schema.id_types.extend(t for _, t in id_pairs)
+    schema.features.extend(n for n, _ in feature_pairs)
+    schema.feature_types.extend(t for _, t in feature_pairs)
+
+    new_x.meta.Pack(imeta)
 
     return new_x
 
@@ -223,14 +235,13 @@ def two_party_balanced_psi_eval_fn(
         ),
         sender_party: os.path.join(ctx.data_dir, sender_path_format[sender_party].uri),
     }
+    local_output_path = os.path.join(ctx.data_dir, psi_output)
     output_path = {
-        receiver_party: os.path.join(ctx.data_dir, psi_output),
-        sender_party: os.path.join(ctx.data_dir, psi_output),
+        receiver_party: local_output_path,
+        sender_party: local_output_path,
     }
 
-    import logging
-
-    logging.warning(spu_config)
+    logging.debug("spu_config=%s", spu_config)
 
     spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
 